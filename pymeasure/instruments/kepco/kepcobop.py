@@ -46,6 +46,8 @@
 # 100-4
 
 from enum import IntFlag
+from functools import lru_cache
+
 from pymeasure.instruments import Instrument, SCPIMixin
 from pymeasure.instruments.validators import strict_discrete_set, \
     truncated_range
@@ -67,6 +69,17 @@ class TestErrorCode(IntFlag):
     OK = 0
 
 
+@lru_cache(maxsize=1024)
+def _to_test_error_code(value):
+    """Convert a self-test reply to a :class:`TestErrorCode`.
+
+    The reply is cast to float by the measurement, so convert to int first
+    (combined flags are rejected otherwise). The domain is bounded by the
+    bitmask, so the results are cached.
+    """
+    return TestErrorCode(int(value))
+
+
 class KepcoBOP3612(SCPIMixin, Instrument):
     """
     Represents the Kepco BOP 36-12 (M or D) 400 W bipolar power supply
@@ -109,7 +122,7 @@ class KepcoBOP3612(SCPIMixin, Instrument):
         Returns 0 if all tests passed, otherwise corresponding error code
         as detailed in manual.
         """,
-        get_process=lambda v: TestErrorCode(v),
+        get_process=_to_test_error_code,
     )
 
     bop_test = Instrument.measurement(
@@ -122,7 +135,7 @@ class KepcoBOP3612(SCPIMixin, Instrument):
         Caution: Output will switch on and swing to maximum values.
         Disconnect any load before testing.
         """,
-        get_process=lambda v: TestErrorCode(v),
+        get_process=_to_test_error_code,
     )
 
     def wait_to_continue(self):
@@ -24,6 +24,7 @@
 
 from pymeasure.test import expected_protocol
 from pymeasure.instruments.kepco import KepcoBOP3612
+from pymeasure.instruments.kepco.kepcobop import TestErrorCode
 
 
 def test_init():
@@ -42,6 +43,14 @@ def test_bop_test_getter():
         assert inst.bop_test == 0
 
 
+def test_bop_test_getter_combined_errors():
+    with expected_protocol(
+            KepcoBOP3612,
+            [(b'DIAG:TST?', b'3')],
+    ) as inst:
+        assert inst.bop_test == TestErrorCode.RAM | TestErrorCode.ROM
+
+
 def test_confidence_test_getter():
     with expected_protocol(
             KepcoBOP3612,